@@ -13,7 +13,7 @@ from agentevals.types import (
 )
 from agentevals.utils import _run_evaluator, _arun_evaluator
 
-from agentevals.trajectory.utils import _normalize_to_openai_messages_list
+from agentevals.trajectory.utils import _normalize_trajectory
 
 from langchain_core.messages import BaseMessage
 
@@ -93,8 +93,8 @@ def create_trajectory_match_evaluator(
         reference_outputs: Union[list[ChatCompletionMessage], list[BaseMessage], dict],
         **kwargs,
     ):
-        outputs = _normalize_to_openai_messages_list(outputs)
-        reference_outputs = _normalize_to_openai_messages_list(reference_outputs)
+        outputs = _normalize_trajectory(outputs)
+        reference_outputs = _normalize_trajectory(reference_outputs)
         return _run_evaluator(
             run_name=f"trajectory_{trajectory_match_mode}_match",
             scorer=scorer,
@@ -181,8 +181,8 @@ def create_async_trajectory_match_evaluator(
         reference_outputs: Union[list[ChatCompletionMessage], list[BaseMessage], dict],
         **kwargs,
     ):
-        outputs = _normalize_to_openai_messages_list(outputs)
-        reference_outputs = _normalize_to_openai_messages_list(reference_outputs)
+        outputs = _normalize_trajectory(outputs)
+        reference_outputs = _normalize_trajectory(reference_outputs)
         return await _arun_evaluator(
             run_name=f"trajectory_{trajectory_match_mode}_match",
             scorer=scorer,
@@ -1,8 +1,7 @@
 from __future__ import annotations
 from warnings import warn
-import json
 
-from agentevals.trajectory.utils import _normalize_to_openai_messages_list
+from agentevals.trajectory.utils import _normalize_trajectory
 from agentevals.types import (
     ChatCompletionMessage,
     ToolArgsMatchMode,
@@ -25,15 +24,17 @@ def _scorer(
     tool_args_match_overrides: Optional[ToolArgsMatchOverrides] = None,
     **kwargs: Any,
 ):
-    outputs = _normalize_to_openai_messages_list(outputs)
-    reference_outputs = _normalize_to_openai_messages_list(reference_outputs)
+    outputs = _normalize_trajectory(outputs)
+    reference_outputs = _normalize_trajectory(reference_outputs)
     if outputs is None or reference_outputs is None:
         raise ValueError(
             "Strict trajectory match requires both outputs and reference_outputs"
         )
     if len(outputs) != len(reference_outputs):
         return False
-    for output, reference_output in zip(outputs, reference_outputs):
+    output_tool_calls_by_message = outputs.tool_calls_by_message
+    reference_tool_calls_by_message = reference_outputs.tool_calls_by_message
+    for i, (output, reference_output) in enumerate(zip(outputs, reference_outputs)):
         if output["role"] != reference_output["role"]:
             return False
         elif ("tool_calls" in output and output["tool_calls"] is not None) != (
@@ -44,32 +45,26 @@ def _scorer(
             return False
         elif "tool_calls" in output and output["tool_calls"] is not None:
             # Both have tool calls, compare them
-            if not isinstance(output["tool_calls"], list) or not isinstance(
-                reference_output["tool_calls"], list
-            ):
+            output_calls = output_tool_calls_by_message[i]
+            reference_calls = reference_tool_calls_by_message[i]
+            if output_calls is None or reference_calls is None:
                 return False
-            if len(output["tool_calls"]) != len(reference_output["tool_calls"]):
+            if len(output_calls) != len(reference_calls):
                 return False
             # Create a copy of reference tool calls to track matches
-            seen = [False] * len(reference_output["tool_calls"])
-            for output_call in output["tool_calls"]:
+            seen = [False] * len(reference_calls)
+            for output_call in output_calls:
                 found_match = False
-                for i, reference_call in enumerate(reference_output["tool_calls"]):
-                    if not seen[i] and (
-                        output_call["function"]["name"]
-                        == reference_call["function"]["name"]
-                    ):
+                for j, reference_call in enumerate(reference_calls):
+                    if not seen[j] and output_call["name"] == reference_call["name"]:
                         matcher = _get_matcher_for_tool_name(
-                            output_call["function"]["name"],
+                            output_call["name"],
                             tool_args_match_mode,
                             tool_args_match_overrides,
                         )
-                        if matcher(
-                            json.loads(output_call["function"]["arguments"]),
-                            json.loads(reference_call["function"]["arguments"]),
-                        ):
+                        if matcher(output_call["args"], reference_call["args"]):
                             found_match = True
-                            seen[i] = True
+                            seen[j] = True
                             break
                 if not found_match:
                     return False
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from warnings import warn
 
-from agentevals.trajectory.utils import _normalize_to_openai_messages_list
+from agentevals.trajectory.utils import _normalize_trajectory
 from agentevals.types import ChatCompletionMessage
 from agentevals.trajectory.utils import _is_trajectory_superset
 from agentevals.utils import _run_evaluator, _arun_evaluator
@@ -25,6 +25,8 @@ def _scorer(
         raise ValueError(
             "Trajectory subset match requires both outputs and reference_outputs"
         )
+    outputs = _normalize_trajectory(outputs)
+    reference_outputs = _normalize_trajectory(reference_outputs)
     is_superset = _is_trajectory_superset(
         reference_outputs, outputs, tool_args_match_mode, tool_args_match_overrides
     )
@@ -65,8 +67,8 @@ def trajectory_subset(
         stacklevel=2,
     )
 
-    outputs = _normalize_to_openai_messages_list(outputs)
-    reference_outputs = _normalize_to_openai_messages_list(reference_outputs)
+    outputs = _normalize_trajectory(outputs)
+    reference_outputs = _normalize_trajectory(reference_outputs)
 
     return _run_evaluator(
         run_name="trajectory_subset",
@@ -113,8 +115,8 @@ async def trajectory_subset_async(
         stacklevel=2,
     )
 
-    outputs = _normalize_to_openai_messages_list(outputs)
-    reference_outputs = _normalize_to_openai_messages_list(reference_outputs)
+    outputs = _normalize_trajectory(outputs)
+    reference_outputs = _normalize_trajectory(reference_outputs)
 
     return await _arun_evaluator(
         run_name="trajectory_subset",
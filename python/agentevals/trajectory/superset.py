@@ -8,7 +8,7 @@ from agentevals.types import (
 )
 from agentevals.trajectory.utils import (
     _is_trajectory_superset,
-    _normalize_to_openai_messages_list,
+    _normalize_trajectory,
 )
 from agentevals.utils import _run_evaluator, _arun_evaluator
 
@@ -30,6 +30,8 @@ def _scorer(
         raise ValueError(
             "Trajectory superset match requires both outputs and reference_outputs"
         )
+    outputs = _normalize_trajectory(outputs)
+    reference_outputs = _normalize_trajectory(reference_outputs)
     is_superset = _is_trajectory_superset(
         outputs, reference_outputs, tool_args_match_mode, tool_args_match_overrides
     )
@@ -70,8 +72,8 @@ def trajectory_superset(
         stacklevel=2,
     )
 
-    outputs = _normalize_to_openai_messages_list(outputs)
-    reference_outputs = _normalize_to_openai_messages_list(reference_outputs)
+    outputs = _normalize_trajectory(outputs)
+    reference_outputs = _normalize_trajectory(reference_outputs)
 
     return _run_evaluator(
         run_name="trajectory_superset",
@@ -118,8 +120,8 @@ async def trajectory_superset_async(
         stacklevel=2,
     )
 
-    outputs = _normalize_to_openai_messages_list(outputs)
-    reference_outputs = _normalize_to_openai_messages_list(reference_outputs)
+    outputs = _normalize_trajectory(outputs)
+    reference_outputs = _normalize_trajectory(reference_outputs)
 
     return await _arun_evaluator(
         run_name="trajectory_superset",
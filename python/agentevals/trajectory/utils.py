@@ -3,7 +3,9 @@ __all__ = [
     "_extract_tool_calls",
     "_get_matcher_for_tool_name",
     "_normalize_to_openai_messages_list",
+    "_normalize_trajectory",
     "_convert_to_openai_message",
+    "_NormalizedTrajectory",
 ]
 
 import json
@@ -17,6 +19,11 @@ from langchain_core.messages import BaseMessage
 from langchain_core.messages.utils import convert_to_openai_messages
 from typing import Callable, Optional, Union
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 
 # More flexible version of converting to OpenAI messages for trajectories
 def _convert_to_openai_message(
@@ -65,17 +72,81 @@ def _normalize_to_openai_messages_list(
     return [_convert_to_openai_message(message) for message in messages]  # type: ignore
 
 
+def _parse_tool_call_arguments(arguments: Union[str, dict]) -> dict:
+    if isinstance(arguments, dict):
+        return arguments
+    if orjson is not None:
+        try:
+            return orjson.loads(arguments)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the stdlib (e.g. NaN, arbitrary size ints)
+            pass
+    return json.loads(arguments)
+
+
 def _normalize_tool_call(tool_call: dict) -> dict:
     if "function" in tool_call:
         return {
             "name": tool_call["function"]["name"],
-            "args": json.loads(tool_call["function"]["arguments"]),
+            "args": _parse_tool_call_arguments(tool_call["function"]["arguments"]),
         }
     else:
         return tool_call
 
 
+class _NormalizedTrajectory(list):
+    """A list of OpenAI-format messages that parses tool call arguments only once.
+
+    Parsed tool calls are computed lazily on first access and shared by every
+    match mode, so scorers that look at a trajectory several times don't
+    re-decode the JSON arguments of each call.
+    """
+
+    def __init__(self, messages=()):
+        super().__init__(messages)
+        self._tool_calls_by_message: Optional[list[Optional[list[dict]]]] = None
+        self._tool_calls: Optional[list[dict]] = None
+
+    @property
+    def tool_calls_by_message(self) -> list[Optional[list[dict]]]:
+        """Parsed tool calls for each message, or None for messages without tool calls."""
+        if self._tool_calls_by_message is None:
+            self._tool_calls_by_message = [
+                [_normalize_tool_call(tool_call) for tool_call in message["tool_calls"]]
+                if isinstance(message.get("tool_calls"), list)
+                else None
+                for message in self
+            ]
+        return self._tool_calls_by_message
+
+    @property
+    def tool_calls(self) -> list[dict]:
+        """Parsed tool calls across all messages, in order."""
+        if self._tool_calls is None:
+            self._tool_calls = [
+                tool_call
+                for message_tool_calls in self.tool_calls_by_message
+                if message_tool_calls is not None
+                for tool_call in message_tool_calls
+            ]
+        return self._tool_calls
+
+
+def _normalize_trajectory(
+    messages: Optional[
+        Union[
+            list[ChatCompletionMessage], list[BaseMessage], ChatCompletionMessage, dict
+        ]
+    ],
+) -> _NormalizedTrajectory:
+    if isinstance(messages, _NormalizedTrajectory):
+        return messages
+    return _NormalizedTrajectory(_normalize_to_openai_messages_list(messages))
+
+
 def _extract_tool_calls(messages: list[ChatCompletionMessage]) -> list[dict]:
+    if isinstance(messages, _NormalizedTrajectory):
+        return messages.tool_calls
     tool_calls: list[dict] = []
     for message in messages:
         if "tool_calls" in message:
@@ -87,6 +158,79 @@ def _extract_tool_calls(messages: list[ChatCompletionMessage]) -> list[dict]:
     return tool_calls
 
 
+def _max_bipartite_matching(adjacency: list[list[int]], num_right: int) -> int:
+    """Size of a maximum matching between left vertices and `num_right` right vertices.
+
+    `adjacency[u]` lists the right vertices compatible with left vertex `u`.
+    Uses Hopcroft-Karp with an iterative DFS so long trajectories don't hit the
+    recursion limit.
+    """
+    num_left = len(adjacency)
+    match_left = [-1] * num_left
+    match_right = [-1] * num_right
+    matching_size = 0
+
+    # Cheap greedy pass first, most real trajectories are fully matched here
+    for u, neighbors in enumerate(adjacency):
+        for v in neighbors:
+            if match_right[v] == -1:
+                match_left[u] = v
+                match_right[v] = u
+                matching_size += 1
+                break
+
+    unreachable = num_left + 1
+    while matching_size < num_left:
+        # BFS from free left vertices to build layers along alternating paths
+        dist = [unreachable] * num_left
+        queue = [u for u in range(num_left) if match_left[u] == -1]
+        for u in queue:
+            dist[u] = 0
+        found_augmenting_path = False
+        head = 0
+        while head < len(queue):
+            u = queue[head]
+            head += 1
+            for v in adjacency[u]:
+                w = match_right[v]
+                if w == -1:
+                    found_augmenting_path = True
+                elif dist[w] == unreachable:
+                    dist[w] = dist[u] + 1
+                    queue.append(w)
+        if not found_augmenting_path:
+            break
+
+        # DFS along the layers to find a maximal set of vertex-disjoint augmenting paths
+        next_edge = [0] * num_left
+        for root in range(num_left):
+            if match_left[root] != -1:
+                continue
+            stack = [root]
+            while stack:
+                u = stack[-1]
+                neighbors = adjacency[u]
+                if next_edge[u] == len(neighbors):
+                    # Dead end, never revisit this vertex during this phase
+                    dist[u] = unreachable
+                    stack.pop()
+                    continue
+                v = neighbors[next_edge[u]]
+                next_edge[u] += 1
+                w = match_right[v]
+                if w == -1:
+                    # Flip the matching along the path on the stack
+                    for left in stack:
+                        right = adjacency[left][next_edge[left] - 1]
+                        match_left[left] = right
+                        match_right[right] = left
+                    matching_size += 1
+                    break
+                if dist[w] == dist[u] + 1:
+                    stack.append(w)
+    return matching_size
+
+
 def _is_trajectory_superset(
     outputs: list[ChatCompletionMessage],
     reference_outputs: list[ChatCompletionMessage],
@@ -95,40 +239,41 @@ def _is_trajectory_superset(
 ):
     output_tool_calls = _extract_tool_calls(outputs)
     reference_tool_calls = _extract_tool_calls(reference_outputs)
-
-    # Keep track of which reference tool calls have been matched
-    matched_reference_calls = set()
-
-    # For each reference tool call, find a matching output tool call
+    if len(reference_tool_calls) > len(output_tool_calls):
+        return False
+
+    # Only calls to the same tool can match each other, so bucket calls by name
+    output_args_by_name: dict[str, list[dict]] = {}
+    for out_call in output_tool_calls:
+        output_args_by_name.setdefault(out_call["name"], []).append(out_call["args"])
+    reference_args_by_name: dict[str, list[dict]] = {}
     for ref_call in reference_tool_calls:
-        ref_name = ref_call["name"]
-        ref_args = ref_call["args"]
-
-        found_match = False
-        for out_idx, out_call in enumerate(output_tool_calls):
-            out_name = out_call["name"]
-
-            # Names must match
-            if ref_name != out_name:
-                continue
-
-            # If we're already using this output call for a different match, skip
-            if out_idx in matched_reference_calls:
-                continue
+        reference_args_by_name.setdefault(ref_call["name"], []).append(ref_call["args"])
 
-            # Check tool args according to match mode
-            matcher = _get_matcher_for_tool_name(
-                ref_name, tool_args_match_mode, tool_args_match_overrides
-            )
-
-            out_args = out_call["args"]
-            if matcher(out_args, ref_args):
-                matched_reference_calls.add(out_idx)
-                found_match = True
-                break
-
-        # If we didn't find a match for this reference call, we're not a superset
-        if not found_match:
+    for tool_name, reference_args in reference_args_by_name.items():
+        output_args = output_args_by_name.get(tool_name, [])
+        if len(reference_args) > len(output_args):
+            return False
+        matcher = _get_matcher_for_tool_name(
+            tool_name, tool_args_match_mode, tool_args_match_overrides
+        )
+        if matcher is _ignore_match:
+            # Every output call is compatible, counts alone decide the match
+            continue
+        # Each reference call must be matched to a distinct output call. A greedy
+        # first-fit assignment can steal an output call a later reference call
+        # needs, so compute a maximum matching over the compatibility graph.
+        adjacency = [
+            [
+                out_idx
+                for out_idx, out_args in enumerate(output_args)
+                if matcher(out_args, ref_args)
+            ]
+            for ref_args in reference_args
+        ]
+        if any(not neighbors for neighbors in adjacency):
+            return False
+        if _max_bipartite_matching(adjacency, len(output_args)) < len(reference_args):
             return False
 
     return True
@@ -1248,3 +1248,101 @@ def test_tool_args_match_mode_exact(tool_args_match_mode, score):
     )
     evaluator_result = evaluator(outputs=outputs, reference_outputs=reference_outputs)
     assert evaluator_result["score"] == score
+
+
+@pytest.mark.langsmith
+@pytest.mark.parametrize(
+    "trajectory_match_mode, output_args, reference_args",
+    [
+        (
+            "superset",
+            [{"query": "weather", "limit": 5}, {"query": "weather"}],
+            [{"query": "weather"}, {"query": "weather", "limit": 5}],
+        ),
+        (
+            "unordered",
+            [{"query": "weather", "limit": 5}, {"query": "weather"}],
+            [{"query": "weather"}, {"query": "weather", "limit": 5}],
+        ),
+        (
+            "subset",
+            [{"query": "weather"}, {"query": "weather", "limit": 5}],
+            [{"query": "weather", "limit": 5}, {"query": "weather"}],
+        ),
+    ],
+)
+def test_trajectory_match_does_not_greedily_steal_tool_calls(
+    trajectory_match_mode, output_args, reference_args
+):
+    def make_trajectory(args_list):
+        return [
+            {"role": "user", "content": "What is the weather?"},
+            {
+                "role": "assistant",
+                "content": "",
+                "tool_calls": [
+                    {
+                        "function": {
+                            "name": "search",
+                            "arguments": json.dumps(args),
+                        }
+                    }
+                    for args in args_list
+                ],
+            },
+            {"role": "assistant", "content": "It's sunny."},
+        ]
+
+    evaluator = create_trajectory_match_evaluator(
+        trajectory_match_mode=trajectory_match_mode,
+        tool_args_match_mode="superset",
+    )
+    evaluator_result = evaluator(
+        outputs=make_trajectory(output_args),
+        reference_outputs=make_trajectory(reference_args),
+    )
+    assert evaluator_result["score"]
+
+
+@pytest.mark.langsmith
+@pytest.mark.parametrize(
+    "trajectory_match_mode", ["strict", "unordered", "subset", "superset"]
+)
+def test_trajectory_match_parses_tool_call_arguments_once(
+    trajectory_match_mode, monkeypatch
+):
+    import agentevals.trajectory.utils as trajectory_utils
+
+    parse_calls = []
+    parse_tool_call_arguments = trajectory_utils._parse_tool_call_arguments
+
+    def counting_parse(arguments):
+        parse_calls.append(arguments)
+        return parse_tool_call_arguments(arguments)
+
+    monkeypatch.setattr(
+        trajectory_utils, "_parse_tool_call_arguments", counting_parse
+    )
+    trajectory = [
+        {"role": "user", "content": "What is the weather in SF and London?"},
+        {
+            "role": "assistant",
+            "content": "",
+            "tool_calls": [
+                {
+                    "function": {
+                        "name": "get_weather",
+                        "arguments": json.dumps({"city": city}),
+                    }
+                }
+                for city in ["SF", "London", "Paris"]
+            ],
+        },
+        {"role": "assistant", "content": "It's sunny everywhere."},
+    ]
+    evaluator = create_trajectory_match_evaluator(
+        trajectory_match_mode=trajectory_match_mode
+    )
+    evaluator_result = evaluator(outputs=trajectory, reference_outputs=trajectory)
+    assert evaluator_result["score"]
+    assert len(parse_calls) == 6